@@ -1,9 +1,12 @@
-from typing import Optional
+from typing import (
+    ClassVar,
+    List,
+    Optional,
+)
 from sqlalchemy.sql.expression import ClauseElement
 from sqlalchemy.orm import DeclarativeBase
 
+
 class Base(DeclarativeBase):
-    @classmethod
-    def default_order_by(cls) -> Optional[ClauseElement]:
-        """Return a SQLAlchemy expression for default ordering or None."""
-        return None
+    # SQLAlchemy expressions for default ordering or None
+    default_order_by: ClassVar[Optional[List[ClauseElement]]] = None
@@ -159,9 +159,7 @@ class MovieModel(Base):
         UniqueConstraint("name", "date", name="unique_movie_constraint"),
     )
 
-    @classmethod
-    def default_order_by(cls) -> object:
-        return [cls.id.desc()]
+    default_order_by = [id.desc()]
 
     def __repr__(self) -> str:
         return f"<Movie(name='{self.name}', release_date='{self.date}', score={self.score})>"
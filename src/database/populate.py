@@ -1,6 +1,10 @@
 import asyncio
 import math
+import re
+from itertools import islice
 from typing import (
+    Iterable,
+    Iterator,
     List,
     Dict,
     Tuple,
@@ -10,10 +14,13 @@ import pandas as pd
 from sqlalchemy import (
     insert,
     select,
-    func,
-    and_,
 )
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+)
 from sqlalchemy.exc import SQLAlchemyError
 from tqdm import tqdm
 
@@ -34,6 +41,23 @@ from database import get_db_contextmanager
 
 CHUNK_SIZE = 1000
 
+CSV_COLUMNS = [
+    'names', 'date_x', 'score', 'genre', 'overview', 'crew', 'status', 'orig_lang', 'budget_x', 'revenue', 'country'
+]
+DIALECT_INSERTS = {
+    'postgresql': postgresql_insert,
+    'sqlite': sqlite_insert,
+}
+WHITESPACE_PATTERN = re.compile(r'\s+')
+NBSP_TRANSLATION = str.maketrans('', '', '\u00A0')
+
+
+def _batched(items: Iterable, size: int) -> Iterator[list]:
+    """Yield successive lists of up to `size` items without index arithmetic (itertools.batched is 3.12+)."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
 
 class CSVDatabaseSeeder:
     def __init__(self, csv_file_path: str, db_session: AsyncSession) -> None:
@@ -41,24 +65,20 @@ class CSVDatabaseSeeder:
         self._db_session = db_session
 
     async def is_db_populated(self) -> bool:
-        result = await self._db_session.execute(select(MovieModel).limit(1))
-        return result.scalars().first() is not None
+        result = await self._db_session.execute(select(select(MovieModel.id).exists()))
+        return bool(result.scalar())
 
     def _preprocess_csv(self) -> pd.DataFrame:
         """Heavy synchronous work, moved to thread later."""
-        data = pd.read_csv(self._csv_file_path)
+        data = pd.read_csv(self._csv_file_path, usecols=CSV_COLUMNS)
         data = data.drop_duplicates(subset=['names', 'date_x'], keep='first')
 
         for col in ['crew', 'genre', 'country', 'orig_lang', 'status']:
             data[col] = data[col].fillna('Unknown').astype(str)
 
-        data['crew'] = (
-            data['crew']
-            .str.replace(r'\s+', '', regex=True)
-            .apply(lambda x: ','.join(sorted(set(x.split(',')))) if x != 'Unknown' else x)
-        )
-        data['genre'] = data['genre'].str.replace('\u00A0', '', regex=True)
-        data['orig_lang'] = data['orig_lang'].str.replace(r'\s+', '', regex=True)
+        data['crew'] = data['crew'].str.replace(WHITESPACE_PATTERN, '', regex=True)
+        data['genre'] = data['genre'].str.translate(NBSP_TRANSLATION)
+        data['orig_lang'] = data['orig_lang'].str.replace(WHITESPACE_PATTERN, '', regex=True)
         data['status'] = data['status'].str.strip()
 
         data['date_x'] = pd.to_datetime(data['date_x'], format='%Y-%m-%d', errors='coerce')
@@ -72,122 +92,132 @@ class CSVDatabaseSeeder:
         data['revenue'] = pd.to_numeric(data['revenue'], errors='coerce').fillna(0.0)
         data['score'] = pd.to_numeric(data['score'], errors='coerce').fillna(0.0)
 
-        print("Preprocessing CSV file...")
-        data.to_csv(self._csv_file_path, index=False)
-        print(f"CSV file saved to {self._csv_file_path}")
+        # Few distinct values repeat across every movie, so categories keep one copy of each string
+        for col in ['country', 'status', 'orig_lang']:
+            data[col] = data[col].astype('category')
+
         return data
 
     async def _seed_user_groups(self) -> None:
-        existing_groups = (
-            (await self._db_session.execute(select(func.count(UserGroupModel.id)))).scalar_one_or_none() or 0
-        )
-        if existing_groups == 0:
+        result = await self._db_session.execute(select(select(UserGroupModel.id).exists()))
+        if not result.scalar():
             groups = [{"name": group.value} for group in UserGroupEnum]
             await self._db_session.execute(insert(UserGroupModel).values(groups))
             await self._db_session.flush()
             print("User groups seeded successfully.")
 
-    async def _get_or_create_bulk(self, model, items: List[str], unique_field: str) -> Dict[str, object]:
+    async def _get_or_create_bulk(
+            self, model, items: List[str], unique_field: str, session: AsyncSession | None = None
+    ) -> Dict[str, object]:
+        session = session or self._db_session
+        field = getattr(model, unique_field)
         existing_dict: Dict[str, object] = {}
-        if items:
-            for i in range(0, len(items), CHUNK_SIZE):
-                chunk = items[i:i + CHUNK_SIZE]
-                result = await self._db_session.execute(
-                    select(model).where(getattr(model, unique_field).in_(chunk))
-                )
-                for obj in result.scalars().all():
-                    existing_dict[getattr(obj, unique_field)] = obj
-
-        new_items = [item for item in items if item not in existing_dict]
-        new_records = [{unique_field: item} for item in new_items]
-
-        if new_records:
-            for i in range(0, len(new_records), CHUNK_SIZE):
-                chunk = new_records[i:i + CHUNK_SIZE]
-                await self._db_session.execute(insert(model).values(chunk))
-                await self._db_session.flush()
-
-            # Select again to map IDs safely
-            for i in range(0, len(new_items), CHUNK_SIZE):
-                chunk = new_items[i:i + CHUNK_SIZE]
-                result_new = await self._db_session.execute(
-                    select(model).where(getattr(model, unique_field).in_(chunk))
-                )
-                for obj in result_new.scalars().all():
-                    existing_dict[getattr(obj, unique_field)] = obj
+
+        # Rows already present are skipped by the database; returned rows expose `.id` for callers
+        dialect_insert = DIALECT_INSERTS[session.bind.dialect.name]
+        insert_stmt = (
+            dialect_insert(model)
+            .on_conflict_do_nothing(index_elements=[unique_field])
+            .returning(model.id, field)
+        )
+        records = [{unique_field: item} for item in items]
+        for i in range(0, len(records), CHUNK_SIZE):
+            result = await session.execute(insert_stmt, records[i:i + CHUNK_SIZE])
+            for row in result:
+                existing_dict[row[1]] = row
+
+        missing = [item for item in items if item not in existing_dict]
+        for i in range(0, len(missing), CHUNK_SIZE):
+            result = await session.execute(select(model.id, field).where(field.in_(missing[i:i + CHUNK_SIZE])))
+            for row in result:
+                existing_dict[row[1]] = row
 
         return existing_dict
 
-    async def _bulk_insert(self, table, data_list: List[Dict[str, int]]) -> None:
-        total_records = len(data_list)
+    async def _get_or_create_bulk_isolated(self, model, items: List[str], unique_field: str) -> Dict[str, object]:
+        """Run `_get_or_create_bulk` in its own session and commit, so several tables can be seeded concurrently."""
+        async with AsyncSession(bind=self._db_session.bind, expire_on_commit=False) as session:
+            result = await self._get_or_create_bulk(model, items, unique_field, session)
+            await session.commit()
+        return result
+
+    async def _bulk_insert(self, table, rows: List[Tuple[int, int]]) -> None:
+        """Insert link rows given as tuples in table column order, building parameter dicts one chunk at a time."""
+        total_records = len(rows)
         if total_records == 0:
             return
         num_chunks = math.ceil(total_records / CHUNK_SIZE)
         table_name = getattr(table, '__tablename__', str(table))
+        columns = table.columns.keys()
 
-        for chunk_index in tqdm(range(num_chunks), desc=f"Inserting into {table_name}"):
-            start = chunk_index * CHUNK_SIZE
-            end = start + CHUNK_SIZE
-            chunk = data_list[start:end]
-            if chunk:
-                await self._db_session.execute(insert(table).values(chunk))
+        for chunk in tqdm(_batched(rows, CHUNK_SIZE), total=num_chunks, desc=f"Inserting into {table_name}"):
+            await self._db_session.execute(insert(table), [dict(zip(columns, row)) for row in chunk])
 
         await self._db_session.flush()
 
+    @staticmethod
+    def _split_tokens(column: pd.Series) -> pd.Series:
+        """Explode a comma-separated column into stripped, non-empty tokens keyed by row index."""
+        tokens = column.dropna().str.split(',').explode().str.strip()
+        return tokens[tokens != '']
+
     async def _prepare_reference_data(
             self, data: pd.DataFrame
     ) -> Tuple[Dict[str, object], Dict[str, object], Dict[str, object], Dict[str, object]]:
-        countries = list(data['country'].unique())
-        genres = {genre.strip() for g in data['genre'].dropna() for genre in g.split(',') if genre.strip()}
-        actors = {actor.strip() for crew in data['crew'].dropna() for actor in crew.split(',') if actor.strip()}
-        languages = {lang.strip() for l in data['orig_lang'].dropna() for lang in l.split(',') if lang.strip()}
-
-        country_map = await self._get_or_create_bulk(CountryModel, countries, 'code')
-        genre_map = await self._get_or_create_bulk(GenreModel, list(genres), 'name')
-        actor_map = await self._get_or_create_bulk(ActorModel, list(actors), 'name')
-        language_map = await self._get_or_create_bulk(LanguageModel, list(languages), 'name')
+        countries = data['country'].unique().tolist()
+        genres = self._split_tokens(data['genre']).unique().tolist()
+        actors = self._split_tokens(data['crew']).unique().tolist()
+        languages = self._split_tokens(data['orig_lang']).unique().tolist()
+
+        bind = self._db_session.bind
+        if not isinstance(bind, AsyncEngine) or bind.dialect.name == 'sqlite':
+            # Concurrent sessions need their own pooled connections: a session bound to one AsyncConnection
+            # cannot share it, and SQLite serializes writers (an in-memory database is a single connection)
+            country_map = await self._get_or_create_bulk(CountryModel, countries, 'code')
+            genre_map = await self._get_or_create_bulk(GenreModel, genres, 'name')
+            actor_map = await self._get_or_create_bulk(ActorModel, actors, 'name')
+            language_map = await self._get_or_create_bulk(LanguageModel, languages, 'name')
+        else:
+            country_map, genre_map, actor_map, language_map = await asyncio.gather(
+                self._get_or_create_bulk_isolated(CountryModel, countries, 'code'),
+                self._get_or_create_bulk_isolated(GenreModel, genres, 'name'),
+                self._get_or_create_bulk_isolated(ActorModel, actors, 'name'),
+                self._get_or_create_bulk_isolated(LanguageModel, languages, 'name'),
+            )
 
         return country_map, genre_map, actor_map, language_map
 
     def _prepare_movies_data(self, data: pd.DataFrame, country_map: Dict[str, object]) -> List[Dict[str, object]]:
-        movies_data: List[Dict[str, object]] = []
-        for _, row in tqdm(data.iterrows(), total=data.shape[0], desc="Processing movies"):
-            country = country_map[row['country']]
-            movie = {
-                "name": row['names'],
-                "date": row['date_x'],
-                "score": float(row['score']),
-                "overview": row['overview'],
-                "status": row['status'],
-                "budget": float(row['budget_x']),
-                "revenue": float(row['revenue']),
-                "country_id": country.id
-            }
-            movies_data.append(movie)
-        return movies_data
-
-    def _prepare_associations(self, data: pd.DataFrame, movie_ids: List[int],
-                              genre_map: Dict[str, object], actor_map: Dict[str, object],
-                              language_map: Dict[str, object]) -> Tuple[List[Dict[str, int]], List[Dict[str, int]], List[Dict[str, int]]]:
-        movie_genres_data, movie_actors_data, movie_languages_data = [], [], []
-
-        for i, (_, row) in enumerate(tqdm(data.iterrows(), total=data.shape[0], desc="Processing associations")):
-            movie_id = movie_ids[i]
-
-            for genre_name in row['genre'].split(','):
-                genre_name = genre_name.strip()
-                if genre_name:
-                    movie_genres_data.append({"movie_id": movie_id, "genre_id": genre_map[genre_name].id})
-
-            for actor_name in row['crew'].split(','):
-                actor_name = actor_name.strip()
-                if actor_name:
-                    movie_actors_data.append({"movie_id": movie_id, "actor_id": actor_map[actor_name].id})
-
-            for lang_name in row['orig_lang'].split(','):
-                lang_name = lang_name.strip()
-                if lang_name:
-                    movie_languages_data.append({"movie_id": movie_id, "language_id": language_map[lang_name].id})
+        country_ids = {code: country.id for code, country in country_map.items()}
+
+        movies = data.rename(columns={'names': 'name', 'date_x': 'date', 'budget_x': 'budget'})
+        movies = movies.assign(country_id=movies['country'].map(country_ids))
+        movies = movies.astype({'score': 'float64', 'budget': 'float64', 'revenue': 'float64'})
+
+        columns = ['name', 'date', 'score', 'overview', 'status', 'budget', 'revenue', 'country_id']
+        return movies[columns].to_dict(orient='records')
+
+    def _explode_links(
+            self, column: pd.Series, movie_ids: pd.Series, fk_map: Dict[str, object]
+    ) -> List[Tuple[int, int]]:
+        names = self._split_tokens(column)
+        links = pd.DataFrame({
+            "movie_id": movie_ids.loc[names.index].values,
+            "fk_id": names.map({name: obj.id for name, obj in fk_map.items()}).values,
+        })
+        # A name repeated within one row must not produce a duplicate primary key
+        links = links.drop_duplicates()
+        return list(zip(links['movie_id'].tolist(), links['fk_id'].tolist()))
+
+    def _prepare_associations(
+            self, data: pd.DataFrame, movie_ids: List[int],
+            genre_map: Dict[str, object], actor_map: Dict[str, object], language_map: Dict[str, object]
+    ) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]], List[Tuple[int, int]]]:
+        movie_ids_series = pd.Series(movie_ids, index=data.index)
+
+        movie_genres_data = self._explode_links(data['genre'], movie_ids_series, genre_map)
+        movie_actors_data = self._explode_links(data['crew'], movie_ids_series, actor_map)
+        movie_languages_data = self._explode_links(data['orig_lang'], movie_ids_series, language_map)
 
         return movie_genres_data, movie_actors_data, movie_languages_data
 
@@ -204,22 +234,13 @@ class CSVDatabaseSeeder:
             country_map, genre_map, actor_map, language_map = await self._prepare_reference_data(data)
             movies_data = await asyncio.to_thread(self._prepare_movies_data, data, country_map)
 
-            # Insert movies with unique key for safe ID mapping
+            # RETURNING hands back ids in parameter order, so no per-movie lookup is needed
             movie_ids = []
+            insert_movies = insert(MovieModel).returning(MovieModel.id, sort_by_parameter_order=True)
             for i in range(0, len(movies_data), CHUNK_SIZE):
                 chunk = movies_data[i:i + CHUNK_SIZE]
-                await self._db_session.execute(insert(MovieModel).values(chunk))
-                await self._db_session.flush()
-
-                # fetch IDs using unique key (name + date)
-                for movie in chunk:
-                    result = await self._db_session.execute(
-                        select(MovieModel.id).where(
-                            and_(MovieModel.name == movie['name'], MovieModel.date == movie['date'])
-                        )
-                    )
-                    movie_id = result.scalar_one()
-                    movie_ids.append(movie_id)
+                result = await self._db_session.execute(insert_movies, chunk)
+                movie_ids.extend(result.scalars().all())
 
             movie_genres_data, movie_actors_data, movie_languages_data = await asyncio.to_thread(
                 self._prepare_associations, data, movie_ids, genre_map, actor_map, language_map
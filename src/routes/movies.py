@@ -85,7 +85,7 @@ async def get_movie_list(
     if not total_items:
         raise HTTPException(status_code=404, detail="No movies found.")
 
-    order_by = MovieModel.default_order_by()
+    order_by = MovieModel.default_order_by
     stmt = select(MovieModel)
     if order_by:
         stmt = stmt.order_by(*order_by)
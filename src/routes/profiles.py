@@ -32,7 +32,7 @@ from database import (
     get_db,
     UserModel,
     UserProfileModel,
-    UserGroupModel,
+    UserGroupEnum,
 )
 from security.interfaces import JWTAuthManagerInterface
 from storages import S3StorageInterface
@@ -85,10 +85,11 @@ async def create_profile(
 
     query = (
         select(UserModel)
-        .options(joinedload(UserModel.profile))
-        .where(UserModel.id == user_id)
+        .options(joinedload(UserModel.profile), joinedload(UserModel.group))
+        .where(UserModel.id.in_({user_id, token_user_id}))
     )
-    user = (await db.execute(query)).scalars().first()
+    users = {user.id: user for user in (await db.execute(query)).scalars().all()}
+    user = users.get(user_id)
 
     if not user or not user.is_active:
         raise HTTPException(
@@ -97,13 +98,8 @@ async def create_profile(
         )
 
     if token_user_id != user_id:
-        query = (
-            select(UserGroupModel.name)
-            .join(UserModel)
-            .where(UserModel.id == token_user_id)
-        )
-        token_user_group_name = (await db.execute(query)).scalar_one_or_none()
-        if token_user_group_name != "admin":
+        token_user = users.get(token_user_id)
+        if not token_user or not token_user.has_group(UserGroupEnum.ADMIN):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You don't have permission to edit this profile.",
@@ -122,8 +118,7 @@ async def create_profile(
             extension = os.path.splitext(uploaded_file.filename)[1] or ".jpg"
             new_filename = f"avatars/{user_id}_avatar{extension}"
 
-            file_bytes = await uploaded_file.read()
-            await s3_client.upload_file(file_name=new_filename, file_data=file_bytes)
+            await s3_client.upload_file(file_name=new_filename, file_data=uploaded_file.file)
 
             file_url = await s3_client.get_file_url(file_name=new_filename)
         except (S3FileUploadError, S3ConnectionError) as e:
@@ -2,18 +2,18 @@ from abc import (
     ABC,
     abstractmethod,
 )
-from typing import Union
+from typing import BinaryIO
 
 
 class S3StorageInterface(ABC):
 
     @abstractmethod
-    async def upload_file(self, file_name: str, file_data: Union[bytes, bytearray]) -> None:
+    async def upload_file(self, file_name: str, file_data: BinaryIO) -> None:
         """
         Uploads a file to the storage.
 
         :param file_name: The name of the file to be stored.
-        :param file_data: The file data in bytes.
+        :param file_data: A binary file-like object positioned at the start of the data.
         :return: URL of the uploaded file.
         """
         pass
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import BinaryIO
 
 import aioboto3
 from botocore.exceptions import (
@@ -40,13 +40,16 @@ class S3StorageClient(S3StorageInterface):
             aws_secret_access_key=self._secret_key,
         )
 
-    async def upload_file(self, file_name: str, file_data: Union[bytes, bytearray]) -> None:
+    async def upload_file(self, file_name: str, file_data: BinaryIO) -> None:
         """
         Asynchronously upload a file to the S3-compatible storage.
 
+        The file object is handed to aioboto3 as is, so the caller does not keep its own bytes copy.
+        aioboto3 still buffers payloads below its multipart threshold and sends them in one request.
+
         Args:
             file_name (str): The name of the file to be stored.
-            file_data (Union[bytes, bytearray]): The file data in bytes.
+            file_data (BinaryIO): A binary file-like object positioned at the start of the data.
 
         Raises:
             S3ConnectionError: If there is a connection error with S3.
@@ -56,11 +59,11 @@ class S3StorageClient(S3StorageInterface):
             async with self._session.client(
                 "s3", endpoint_url=self._endpoint_url
             ) as client:
-                await client.put_object(
-                    Bucket=self._bucket_name,
-                    Key=file_name,
-                    Body=file_data,
-                    ContentType="image/jpeg"
+                await client.upload_fileobj(
+                    file_data,
+                    self._bucket_name,
+                    file_name,
+                    ExtraArgs={"ContentType": "image/jpeg"}
                 )
         except (ConnectionError, HTTPClientError, NoCredentialsError) as e:
             raise S3ConnectionError(f"Failed to connect to S3 storage: {str(e)}") from e
@@ -144,6 +144,20 @@ async def e2e_client() -> AsyncGenerator[AsyncClient, Any]:
         yield async_client
 
 
+@pytest_asyncio.fixture(scope="session")
+async def mailhog_client(settings) -> AsyncGenerator[AsyncClient, Any]:
+    """
+    Provide an asynchronous HTTP client for the MailHog API.
+
+    This client is available at the session scope, so end-to-end tests reuse one connection pool
+    instead of opening a new one every time they poll for an email. Its pooled connections are bound
+    to the session event loop, so tests using it must be marked `asyncio(loop_scope="session")`.
+    """
+    base_url = f"http://{settings.EMAIL_HOST}:{settings.MAILHOG_API_PORT}"
+    async with AsyncClient(base_url=base_url) as async_client:
+        yield async_client
+
+
 @pytest_asyncio.fixture(scope="function")
 async def db_session() -> AsyncGenerator[AsyncSession, Any]:
     """
@@ -1,6 +1,6 @@
 from typing import (
+    BinaryIO,
     Dict,
-    Union,
 )
 
 from storages import S3StorageInterface
@@ -20,14 +20,14 @@ class FakeS3Storage(S3StorageInterface):
         """
         self.storage: Dict[str, bytes] = {}
 
-    async def upload_file(self, file_name: str, file_data: Union[bytes, bytearray]) -> None:
+    async def upload_file(self, file_name: str, file_data: BinaryIO) -> None:
         """
         Simulates file upload to S3 by storing the file data in a dictionary.
 
         :param file_name: The name of the file to be stored.
-        :param file_data: The file data in bytes.
+        :param file_data: A binary file-like object positioned at the start of the data.
         """
-        self.storage[file_name] = file_data
+        self.storage[file_name] = file_data.read()
 
     async def get_file_url(self, file_name: str) -> str:
         """
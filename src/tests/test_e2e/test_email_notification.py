@@ -6,7 +6,6 @@ from sqlalchemy import select
 from sqlalchemy.orm import joinedload
 from validators import url as validate_url
 import pytest
-import httpx
 from bs4 import BeautifulSoup
 import asyncio
 
@@ -18,28 +17,37 @@ from database import (
 )
 
 
-async def fetch_email(mailhog_url, expected_to, expected_subject, timeout=5):
+async def fetch_email(mailhog_client, expected_to, expected_subject, timeout=5):
     """
-    Fetch email from MailHog, retrying for a few seconds until the expected message appears.
+    Fetch email from MailHog, retrying for up to `timeout` seconds until the expected message appears.
+
+    Polling starts at 50 ms and backs off exponentially (capped at 500 ms), so an email that is
+    already delivered is found almost immediately. The shared `mailhog_client` keeps its connection
+    alive across retries and tests.
     """
-    async with httpx.AsyncClient() as client:
-        for _ in range(timeout):
-            resp = await client.get(mailhog_url)
-            resp.raise_for_status()
-            messages = resp.json()["items"]
-            for msg in messages:
-                to_header = msg["Content"]["Headers"]["To"]
-                subject_header = msg["Content"]["Headers"].get("Subject", [""])[0]
-                if expected_to in to_header and expected_subject in subject_header:
-                    return msg
-            await asyncio.sleep(1)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 0.05
+    while True:
+        resp = await mailhog_client.get("/api/v2/messages")
+        resp.raise_for_status()
+        messages = resp.json()["items"]
+        for msg in messages:
+            to_header = msg["Content"]["Headers"]["To"]
+            subject_header = msg["Content"]["Headers"].get("Subject", [""])[0]
+            if expected_to in to_header and expected_subject in subject_header:
+                return msg
+        if loop.time() >= deadline:
+            break
+        await asyncio.sleep(min(delay, max(deadline - loop.time(), 0)))
+        delay = min(delay * 2, 0.5)
     raise AssertionError(f"Email to {expected_to} with subject '{expected_subject}' not found after {timeout}s")
 
 
 @pytest.mark.e2e
 @pytest.mark.order(1)
-@pytest.mark.asyncio
-async def test_registration(e2e_client, reset_db_once_for_e2e, settings, seed_user_groups, e2e_db_session) -> None:
+@pytest.mark.asyncio(loop_scope="session")
+async def test_registration(e2e_client, reset_db_once_for_e2e, mailhog_client, seed_user_groups, e2e_db_session) -> None:
     """
     End-to-end test for user registration.
 
@@ -68,8 +76,7 @@ async def test_registration(e2e_client, reset_db_once_for_e2e, settings, seed_us
     e2e_db_session.expire_all()
 
     # Fetch email from MailHog
-    mailhog_url = f"http://{settings.EMAIL_HOST}:{settings.MAILHOG_API_PORT}/api/v2/messages"
-    email = await fetch_email(mailhog_url, expected_to=user_data["email"], expected_subject="Account Activation")
+    email = await fetch_email(mailhog_client, expected_to=user_data["email"], expected_subject="Account Activation")
 
     email_html = email["Content"]["Body"]
     email_subject = email["Content"]["Headers"].get("Subject", [""])[0]
@@ -93,8 +100,8 @@ async def test_registration(e2e_client, reset_db_once_for_e2e, settings, seed_us
 
 @pytest.mark.e2e
 @pytest.mark.order(2)
-@pytest.mark.asyncio
-async def test_account_activation(e2e_client, settings, e2e_db_session) -> None:
+@pytest.mark.asyncio(loop_scope="session")
+async def test_account_activation(e2e_client, mailhog_client, e2e_db_session) -> None:
     """
     End-to-end test for account activation.
 
@@ -137,8 +144,7 @@ async def test_account_activation(e2e_client, settings, e2e_db_session) -> None:
     assert activated_user.is_active, f"User {user_email} is not active!"
 
     # Verify activation email
-    mailhog_url = f"http://{settings.EMAIL_HOST}:{settings.MAILHOG_API_PORT}/api/v2/messages"
-    email = await fetch_email(mailhog_url, expected_to=user_email, expected_subject="Account Activated Successfully")
+    email = await fetch_email(mailhog_client, expected_to=user_email, expected_subject="Account Activated Successfully")
 
     email_html = email["Content"]["Body"]
     soup = BeautifulSoup(email_html, "html.parser")
@@ -160,7 +166,7 @@ async def test_account_activation(e2e_client, settings, e2e_db_session) -> None:
 # ---- User login tests ----
 @pytest.mark.e2e
 @pytest.mark.order(3)
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_user_login(e2e_client, e2e_db_session) -> None:
     """
     End-to-end test for user login (async version).
@@ -201,8 +207,8 @@ async def test_user_login(e2e_client, e2e_db_session) -> None:
 # ---- Password reset tests ----
 @pytest.mark.e2e
 @pytest.mark.order(4)
-@pytest.mark.asyncio
-async def test_request_password_reset(e2e_client, e2e_db_session, settings) -> None:
+@pytest.mark.asyncio(loop_scope="session")
+async def test_request_password_reset(e2e_client, e2e_db_session, mailhog_client) -> None:
     """
     End-to-end test for requesting a password reset (async version).
 
@@ -233,8 +239,7 @@ async def test_request_password_reset(e2e_client, e2e_db_session, settings) -> N
     reset_token = (await e2e_db_session.execute(stmt)).scalars().first()
     assert reset_token, f"Password reset token for email {user_email} was not created!"
 
-    mailhog_url = f"http://{settings.EMAIL_HOST}:{settings.MAILHOG_API_PORT}/api/v2/messages"
-    email_data = await fetch_email(mailhog_url, expected_to=user_email, expected_subject="Password Reset Request")
+    email_data = await fetch_email(mailhog_client, expected_to=user_email, expected_subject="Password Reset Request")
 
     email_html = email_data["Content"]["Body"]
     soup = BeautifulSoup(email_html, "html.parser")
@@ -0,0 +1,102 @@
+import pandas as pd
+import pytest
+from sqlalchemy import (
+    insert,
+    select,
+    func,
+)
+
+from config import get_settings
+from database import (
+    MovieModel,
+    GenreModel,
+    LanguageModel,
+    CountryModel,
+    MoviesGenresModel,
+    MoviesLanguagesModel,
+)
+from database.populate import CSVDatabaseSeeder
+
+
+def _expected_links(data: pd.DataFrame, column: str, strip_whitespace: bool = False) -> set:
+    """
+    Build the (movie name, token) pairs the seeder should link for a comma-separated CSV column.
+    """
+    links = set()
+    for name, value in zip(data["names"], data[column]):
+        for token in str(value).split(","):
+            token = "".join(token.split()) if strip_whitespace else token.replace("\u00A0", "").strip()
+            if token:
+                links.add((name, token))
+    return links
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [None, 2])
+async def test_seed_reuses_existing_reference_rows(db_session, monkeypatch, chunk_size) -> None:
+    """
+    Test that seeding a database which already holds some reference rows links movies to those rows.
+
+    Steps:
+    1. Pre-insert genres, a language and a country with explicit ids, plus a genre absent from the CSV.
+    2. Run `CSVDatabaseSeeder.seed()`; ON CONFLICT DO NOTHING skips the existing rows, which the
+       follow-up SELECT then resolves (with `chunk_size=2` it resolves them across several chunks).
+    3. Verify that the pre-existing ids are kept, no duplicates are created and every link matches the CSV.
+    """
+    if chunk_size is not None:
+        monkeypatch.setattr("database.populate.CHUNK_SIZE", chunk_size)
+
+    settings = get_settings()
+    data = pd.read_csv(settings.PATH_TO_MOVIES_CSV).drop_duplicates(subset=["names", "date_x"], keep="first")
+
+    existing_genres = {"Drama": 101, "Action": 102, "Comedy": 103, "Western Noir": 104}
+    await db_session.execute(
+        insert(GenreModel), [{"id": genre_id, "name": name} for name, genre_id in existing_genres.items()]
+    )
+    await db_session.execute(insert(LanguageModel), [{"id": 201, "name": "English"}])
+    await db_session.execute(insert(CountryModel), [{"id": 301, "code": "US", "name": None}])
+    await db_session.commit()
+
+    seeder = CSVDatabaseSeeder(csv_file_path=settings.PATH_TO_MOVIES_CSV, db_session=db_session)
+    await seeder.seed()
+
+    genre_ids = dict((await db_session.execute(select(GenreModel.name, GenreModel.id))).all())
+    for name, genre_id in existing_genres.items():
+        assert genre_ids[name] == genre_id, f"Genre '{name}' should keep id {genre_id}, got {genre_ids[name]}"
+
+    genre_names = {genre for _, genre in _expected_links(data, "genre")}
+    assert set(genre_ids) == genre_names | {"Western Noir"}, "Genres should not be duplicated or lost"
+
+    language_id = await db_session.scalar(select(LanguageModel.id).where(LanguageModel.name == "English"))
+    assert language_id == 201, f"Language 'English' should keep id 201, got {language_id}"
+
+    country_id = await db_session.scalar(select(CountryModel.id).where(CountryModel.code == "US"))
+    assert country_id == 301, f"Country 'US' should keep id 301, got {country_id}"
+    country_count = await db_session.scalar(select(func.count(CountryModel.id)))
+    assert country_count == data["country"].nunique(), "Countries should not be duplicated"
+
+    us_movies = (await db_session.execute(
+        select(MovieModel.name).where(MovieModel.country_id == 301)
+    )).scalars().all()
+    assert sorted(us_movies) == sorted(data.loc[data["country"] == "US", "names"]), \
+        "Movies from 'US' should reference the pre-existing country row"
+
+    genre_links = set((await db_session.execute(
+        select(MovieModel.name, GenreModel.name)
+        .join(MoviesGenresModel, MoviesGenresModel.c.movie_id == MovieModel.id)
+        .join(GenreModel, GenreModel.id == MoviesGenresModel.c.genre_id)
+    )).all())
+    assert genre_links == _expected_links(data, "genre"), "Movie-genre links do not match the CSV"
+
+    language_links = set((await db_session.execute(
+        select(MovieModel.name, LanguageModel.name)
+        .join(MoviesLanguagesModel, MoviesLanguagesModel.c.movie_id == MovieModel.id)
+        .join(LanguageModel, LanguageModel.id == MoviesLanguagesModel.c.language_id)
+    )).all())
+    assert language_links == _expected_links(data, "orig_lang", strip_whitespace=True), \
+        "Movie-language links do not match the CSV"
+
+    unused_links = await db_session.scalar(
+        select(func.count()).select_from(MoviesGenresModel).where(MoviesGenresModel.c.genre_id == 104)
+    )
+    assert unused_links == 0, "A pre-existing genre absent from the CSV should not be linked to any movie"
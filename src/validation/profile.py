@@ -1,51 +1,61 @@
-import re
+import os
 from datetime import date
-from io import BytesIO
 
-from PIL import Image
 from fastapi import UploadFile
 
 from database.models.accounts import GenderEnum
 
+MAX_IMAGE_SIZE = 1 * 1024 * 1024  # 1 MB
+JPEG_SIGNATURE = b"\xff\xd8\xff"
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+GENDER_VALUES = frozenset(gender.value for gender in GenderEnum)
+GENDER_ERROR = f"Gender must be one of: {', '.join(gender.value for gender in GenderEnum)}"
+
 
 def validate_name(name: str) -> str:
     """
     Validates that the name contains only English letters and is non-empty.
     Returns the lowercase version of the name.
     """
-    if re.search(r"^[A-Za-z]+$", name) is None:
+    # For ASCII input isalpha() is exactly [A-Za-z]; an empty string fails isalpha()
+    if not (name.isascii() and name.isalpha()):
         raise ValueError(f"{name} contains non-English letters or is empty")
     return name.lower()
 
 
+def _detect_format(head: bytes) -> str | None:
+    """
+    Detects JPEG and PNG images from their leading magic bytes.
+    Returns the format name, or None if the bytes match neither signature.
+    """
+    if head.startswith(JPEG_SIGNATURE):
+        return "JPEG"
+    if head.startswith(PNG_SIGNATURE):
+        return "PNG"
+    return None
+
+
 def validate_image(avatar: UploadFile) -> UploadFile:
     """
     Validates the uploaded image file.
 
     Checks:
     - File size must not exceed 1 MB.
-    - Image format must be one of the supported formats: JPG, JPEG, PNG.
+    - Image format must be JPEG (JPG) or PNG, detected from the file signature.
     - Resets file pointer to start regardless of success or failure.
     """
-    supported_image_formats = ["JPG", "JPEG", "PNG"]
-    max_file_size = 1 * 1024 * 1024  # 1 MB
-
-    contents = avatar.file.read()
-    if len(contents) > max_file_size:
-        avatar.file.seek(0)
+    # Measure the size from the file position so oversized uploads are rejected without reading them
+    avatar.file.seek(0, os.SEEK_END)
+    file_size = avatar.file.tell()
+    avatar.file.seek(0)
+    if file_size > MAX_IMAGE_SIZE:
         raise ValueError("Image size exceeds 1 MB")
 
     try:
-        image = Image.open(BytesIO(contents))
-        # Normalize format for reliable comparison
-        image_format = (image.format or "").upper()
-        if image_format not in supported_image_formats:
-            raise ValueError(
-                f"Unsupported image format: {image_format}. "
-                f"Use one of: {', '.join(supported_image_formats)}."
-            )
-    except IOError:
-        raise ValueError("Invalid image format")
+        head = avatar.file.read(len(PNG_SIGNATURE))
+        if _detect_format(head) is None:
+            raise ValueError("Invalid image format")
     finally:
         # Always reset the file pointer regardless of success or failure
         avatar.file.seek(0)
@@ -58,12 +68,9 @@ def validate_gender(gender: str) -> str:
     Validates that the gender is one of the allowed values defined in GenderEnum.
     Returns the string value for JSON serialization and downstream consistency.
     """
-    try:
-        return GenderEnum(gender).value
-    except ValueError:
-        raise ValueError(
-            f"Gender must be one of: {', '.join(g.value for g in GenderEnum)}"
-        )
+    if gender not in GENDER_VALUES:
+        raise ValueError(GENDER_ERROR)
+    return gender
 
 
 def validate_birth_date(birth_date: date) -> date:
@@ -78,8 +85,8 @@ def validate_birth_date(birth_date: date) -> date:
     if birth_date > today:
         raise ValueError("Birth date cannot be in the future.")
 
-    age = today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
-    if age < 18:
+    # At least 18 years old <=> born on or before the same calendar day 18 years ago
+    if (birth_date.year, birth_date.month, birth_date.day) > (today.year - 18, today.month, today.day):
         raise ValueError("You must be at least 18 years old to register.")
     return birth_date
 
@@ -91,7 +98,8 @@ def validate_info(info: str | None = None) -> str | None:
     """
     if info is None:
         return None
+    # str.strip() returns the same object when there is nothing to strip, so no copy on the common path
     stripped_info = info.strip()
-    if len(stripped_info) == 0:
+    if not stripped_info:
         raise ValueError("Info field cannot be empty or contain only spaces.")
     return stripped_info